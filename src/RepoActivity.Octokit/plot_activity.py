@@ -1,4 +1,12 @@
+import sys
 import pandas as pd
+import matplotlib
+
+# Headless runs only save the PNGs, so skip loading a GUI backend
+INTERACTIVE = sys.stdout.isatty()
+if not INTERACTIVE:
+    matplotlib.use("Agg")
+
 import matplotlib.pyplot as plt
 import matplotlib.dates as mdates
 from datetime import datetime
@@ -6,50 +14,38 @@ import numpy as np
 
 def load_and_plot_activity(csv_file):
     # Load the data
-    df = pd.read_csv(csv_file)
-    df['Month'] = pd.to_datetime(df['Month'])
+    counts = {'Commits': 'int32', 'PullRequests': 'int32', 'Issues': 'int32', 'ActionsRuns': 'int32'}
+    df = pd.read_csv(csv_file, parse_dates=['Month'], dtype=counts)
     df = df.sort_values('Month')
     
     # Create figure with subplots
-    fig, ((ax1, ax2), (ax3, ax4)) = plt.subplots(2, 2, figsize=(15, 12))
+    # x_compat keeps matplotlib date units so the mdates formatters below apply
+    axes = df.set_index('Month')[['Commits', 'PullRequests', 'Issues', 'ActionsRuns']].plot(
+        subplots=True, layout=(2, 2), figsize=(15, 12), sharex=False, legend=False, x_compat=True,
+        style=['o-', 's-', '^-', 'D-'], color=['#2E8B57', '#4169E1', '#DC143C', '#FF8C00'],
+        linewidth=2, markersize=6, xlabel='')
+    fig = axes[0, 0].figure
     fig.suptitle('GitHub Repository Activity Over Time\n(Microsoft/VSCode)', fontsize=16, fontweight='bold')
     
-    # Plot 1: Commits
-    ax1.plot(df['Month'], df['Commits'], marker='o', linewidth=2, markersize=6, color='#2E8B57')
-    ax1.set_title('Commits Created Per Month', fontweight='bold')
-    ax1.set_ylabel('Number of Commits')
-    ax1.grid(True, alpha=0.3)
-    ax1.tick_params(axis='x', rotation=45)
-    
-    # Plot 2: Pull Requests
-    ax2.plot(df['Month'], df['PullRequests'], marker='s', linewidth=2, markersize=6, color='#4169E1')
-    ax2.set_title('Pull Requests Created Per Month', fontweight='bold')
-    ax2.set_ylabel('Number of Pull Requests')
-    ax2.grid(True, alpha=0.3)
-    ax2.tick_params(axis='x', rotation=45)
-    
-    # Plot 3: Issues
-    ax3.plot(df['Month'], df['Issues'], marker='^', linewidth=2, markersize=6, color='#DC143C')
-    ax3.set_title('Issues Created Per Month', fontweight='bold')
-    ax3.set_ylabel('Number of Issues')
-    ax3.grid(True, alpha=0.3)
-    ax3.tick_params(axis='x', rotation=45)
-    
-    # Plot 4: Actions Runs
-    ax4.plot(df['Month'], df['ActionsRuns'], marker='D', linewidth=2, markersize=6, color='#FF8C00')
-    ax4.set_title('GitHub Actions Runs Per Month', fontweight='bold')
-    ax4.set_ylabel('Number of Actions Runs')
-    ax4.grid(True, alpha=0.3)
-    ax4.tick_params(axis='x', rotation=45)
-    
-    # Format x-axis for all subplots
-    for ax in [ax1, ax2, ax3, ax4]:
+    titles = [
+        ('Commits Created Per Month', 'Number of Commits'),
+        ('Pull Requests Created Per Month', 'Number of Pull Requests'),
+        ('Issues Created Per Month', 'Number of Issues'),
+        ('GitHub Actions Runs Per Month', 'Number of Actions Runs')
+    ]
+    for ax, (title, ylabel) in zip(axes.flat, titles):
+        ax.set_title(title, fontweight='bold')
+        ax.set_ylabel(ylabel)
+        ax.grid(True, alpha=0.3)
+        ax.tick_params(axis='x', rotation=45)
         ax.xaxis.set_major_formatter(mdates.DateFormatter('%Y-%m'))
         ax.xaxis.set_major_locator(mdates.MonthLocator(interval=2))
     
     plt.tight_layout()
     plt.savefig('github_activity_breakdown.png', dpi=300, bbox_inches='tight')
-    plt.show()
+    if INTERACTIVE:
+        plt.show()
+    plt.close(fig)
     
     # Create combined plot
     fig2, ax = plt.subplots(1, 1, figsize=(14, 8))
@@ -81,27 +77,32 @@ def load_and_plot_activity(csv_file):
     
     plt.tight_layout()
     plt.savefig('github_activity_combined.png', dpi=300, bbox_inches='tight')
-    plt.show()
+    if INTERACTIVE:
+        plt.show()
+    plt.close(fig2)
     
     # Print analysis
     print("\n=== ACTIVITY ANALYSIS ===")
     print(f"Data period: {df['Month'].min().strftime('%Y-%m')} to {df['Month'].max().strftime('%Y-%m')}")
     
-    totals = {
-        'Commits': df['Commits'].sum(),
-        'Pull Requests': df['PullRequests'].sum(),
-        'Issues': df['Issues'].sum(),
-        'Actions Runs': df['ActionsRuns'].sum()
+    # One pass over the activity columns for every summary statistic below
+    cols = ['Commits', 'PullRequests', 'Issues', 'ActionsRuns']
+    agg = df.set_index('Month')[cols].agg(['sum', 'mean', 'max', 'idxmax'])
+    labels = {
+        'Commits': 'Commits',
+        'PullRequests': 'Pull Requests',
+        'Issues': 'Issues',
+        'ActionsRuns': 'Actions Runs'
     }
+    totals = {label: agg.loc['sum', col] for col, label in labels.items()}
     
     print(f"\nTotal Activities:")
     for activity, total in totals.items():
         print(f"  {activity}: {total:,}")
     
     print(f"\nMonthly Averages:")
-    for activity, total in totals.items():
-        avg = total / len(df)
-        print(f"  {activity}: {avg:.1f}")
+    for col, activity in labels.items():
+        print(f"  {activity}: {agg.loc['mean', col]:.1f}")
     
     # Calculate trends
     print(f"\nActivity Balance:")
@@ -114,16 +115,16 @@ def load_and_plot_activity(csv_file):
     print(f"  Automation (Actions): {total_automation:,} ({total_automation/sum(totals.values())*100:.1f}% of all activities)")
     
     # Peak months
-    peak_commits_month = df.loc[df['Commits'].idxmax(), 'Month'].strftime('%Y-%m')
-    peak_prs_month = df.loc[df['PullRequests'].idxmax(), 'Month'].strftime('%Y-%m')
-    peak_issues_month = df.loc[df['Issues'].idxmax(), 'Month'].strftime('%Y-%m')
-    peak_actions_month = df.loc[df['ActionsRuns'].idxmax(), 'Month'].strftime('%Y-%m')
+    peak_commits_month = agg.loc['idxmax', 'Commits'].strftime('%Y-%m')
+    peak_prs_month = agg.loc['idxmax', 'PullRequests'].strftime('%Y-%m')
+    peak_issues_month = agg.loc['idxmax', 'Issues'].strftime('%Y-%m')
+    peak_actions_month = agg.loc['idxmax', 'ActionsRuns'].strftime('%Y-%m')
     
     print(f"\nPeak Activity Months:")
-    print(f"  Commits: {peak_commits_month} ({df['Commits'].max()} commits)")
-    print(f"  Pull Requests: {peak_prs_month} ({df['PullRequests'].max()} PRs)")
-    print(f"  Issues: {peak_issues_month} ({df['Issues'].max()} issues)")
-    print(f"  Actions: {peak_actions_month} ({df['ActionsRuns'].max()} runs)")
+    print(f"  Commits: {peak_commits_month} ({agg.loc['max', 'Commits']} commits)")
+    print(f"  Pull Requests: {peak_prs_month} ({agg.loc['max', 'PullRequests']} PRs)")
+    print(f"  Issues: {peak_issues_month} ({agg.loc['max', 'Issues']} issues)")
+    print(f"  Actions: {peak_actions_month} ({agg.loc['max', 'ActionsRuns']} runs)")
 
 if __name__ == "__main__":
     # Update this path to match your CSV file